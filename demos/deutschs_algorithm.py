@@ -1,9 +1,9 @@
 import sys 
 import os
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from src.quantum_simulator.quantum_state import QuantumState
+from quantum_simulator import QuantumState
 
 # Function to choose each of the four oracle cases of U_f
 def U_f(q: QuantumState, case: int):
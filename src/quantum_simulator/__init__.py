@@ -0,0 +1,6 @@
+from .quantum_state import QuantumState
+from .mps_state import MPSState
+from .gate import Gate
+from .utils import abs_squared, e_norm, is_pow_of_2
+
+__all__ = ["QuantumState", "MPSState", "Gate", "abs_squared", "e_norm", "is_pow_of_2"]
@@ -0,0 +1,129 @@
+import numpy.typing as npt
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+if NUMBA_AVAILABLE:
+    @njit(inline='always')
+    def _pair(p: int, k: int) -> int:
+        """
+        Returns the index of the p-th amplitude whose bit `k` is 0,
+        found by inserting a 0 bit at position `k` of `p`. Its
+        partner differs only in bit `k`
+
+        Args:
+            p (int): the pair number, 0 <= p < N/2
+            k (int): the bit position of the target qubit
+
+        Returns:
+            int: the index of the first amplitude of the pair
+        """
+        low = p & ((1 << k) - 1)
+        return ((p - low) << 1) | low
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_1q(state: npt.NDArray, g00: complex, g01: complex, g10: complex, g11: complex, k: int):
+        """
+        Applies a 2x2 operation in place to the qubit at bit
+        position `k` of a contiguous complex statevector.
+        Amplitude pairs are independent and are processed in
+        parallel, whichever qubit is targeted
+
+        Args:
+            state (npt.NDArray): the statevector
+            g00, g01, g10, g11 (complex): the entries of the operation
+            k (int): the bit position of the target qubit
+        """
+        stride = 1 << k
+        for p in prange(state.size >> 1):
+            i0 = _pair(p, k)
+            i1 = i0 + stride
+            a = state[i0]
+            b = state[i1]
+            state[i0] = g00 * a + g01 * b
+            state[i1] = g10 * a + g11 * b
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_x(state: npt.NDArray, k: int):
+        """
+        Applies a bit flip in place to the qubit at bit position
+        `k` by swapping each pair of amplitudes
+
+        Args:
+            state (npt.NDArray): the statevector
+            k (int): the bit position of the target qubit
+        """
+        stride = 1 << k
+        for p in prange(state.size >> 1):
+            i0 = _pair(p, k)
+            i1 = i0 + stride
+            tmp = state[i0]
+            state[i0] = state[i1]
+            state[i1] = tmp
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_z(state: npt.NDArray, k: int):
+        """
+        Applies a phase flip in place to the qubit at bit position
+        `k` by negating the amplitudes where the qubit is 1
+
+        Args:
+            state (npt.NDArray): the statevector
+            k (int): the bit position of the target qubit
+        """
+        stride = 1 << k
+        for p in prange(state.size >> 1):
+            i1 = _pair(p, k) + stride
+            state[i1] = -state[i1]
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_h(state: npt.NDArray, k: int, scale: float):
+        """
+        Applies a Hadamard gate in place to the qubit at bit
+        position `k`, mapping each pair (a, b) to
+        ((a + b) * scale, (a - b) * scale)
+
+        Args:
+            state (npt.NDArray): the statevector
+            k (int): the bit position of the target qubit
+            scale (float): the normalization factor, 1/sqrt(2)
+        """
+        stride = 1 << k
+        for p in prange(state.size >> 1):
+            i0 = _pair(p, k)
+            i1 = i0 + stride
+            a = state[i0]
+            b = state[i1]
+            state[i0] = (a + b) * scale
+            state[i1] = (a - b) * scale
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def apply_cnot(state: npt.NDArray, ck: int, tk: int):
+        """
+        Applies a controlled NOT gate in place to a contiguous
+        complex statevector by swapping each amplitude whose
+        control bit is 1 and target bit is 0 with its partner
+
+        Args:
+            state (npt.NDArray): the statevector
+            ck (int): the bit position of the control qubit
+            tk (int): the bit position of the target qubit
+        """
+        control_mask = 1 << ck
+        target_mask = 1 << tk
+        for i in prange(state.size):
+            if (i & control_mask) and not (i & target_mask):
+                j = i | target_mask
+                tmp = state[i]
+                state[i] = state[j]
+                state[j] = tmp
+else:
+    apply_1q = None
+    apply_x = None
+    apply_z = None
+    apply_h = None
+    apply_cnot = None
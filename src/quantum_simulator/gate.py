@@ -1,13 +1,37 @@
 import numpy as np
 import numpy.typing as npt
+from weakref import WeakValueDictionary
+
+# Read-only arrays that own their data and have already passed
+# validation, keyed by id(). Storing the array itself guarantees the id
+# has not been reused by another object. Writeable arrays and views are
+# never cached, since they (or their base) could change after validation
+_validated = WeakValueDictionary()
 
 class Gate:
-    def __init__(self, matrix: npt.NDArray | list):
+    def __init__(self, matrix: npt.NDArray | list, validate: bool = True):
+        """
+        Represents a quantum gate through a unitary matrix
+
+        Args:
+            matrix (npt.NDArray | list): the matrix of the gate
+            validate (bool): whether to check that the matrix is unitary;
+                pass False for matrices known to be unitary
+
+        Raises:
+            Exception: the operation must be a square matrix
+            Exception: the operation must be a unitary matrix
+        """
+        source = matrix
         matrix = np.array(matrix, dtype=complex)
-        if matrix.shape[0] != matrix.shape[1]:
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
             raise Exception("The operation must be a square matrix")
-        if not np.allclose((matrix @ np.conjugate(matrix).T), np.identity(matrix.shape[0]), atol=1e-5):
-            raise Exception("The operation must be a unitary matrix")
+        if validate and _validated.get(id(source)) is not source:
+            d = matrix.shape[0]
+            if np.linalg.norm(matrix @ np.conjugate(matrix).T - np.identity(d)) > 1e-5 * d:
+                raise Exception("The operation must be a unitary matrix")
+            if isinstance(source, np.ndarray) and source.base is None and not source.flags.writeable:
+                _validated[id(source)] = source
         self.operation = matrix
     
     def to_numpy(self):
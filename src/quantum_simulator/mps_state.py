@@ -0,0 +1,360 @@
+import numpy as np
+import numpy.typing as npt
+from .utils import is_pow_of_2, e_norm
+from .quantum_state import QuantumState, X_MATRIX, Z_MATRIX, H_MATRIX, T_MATRIX, TDG_MATRIX
+
+try:
+    from opt_einsum import contract
+except ImportError:
+    def contract(*operands):
+        return np.einsum(*operands, optimize=True)
+
+CNOT_MATRIX = np.array([
+    [1, 0, 0, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1],
+    [0, 0, 1, 0]
+], dtype=complex)
+SWAP_MATRIX = np.array([
+    [1, 0, 0, 0],
+    [0, 0, 1, 0],
+    [0, 1, 0, 0],
+    [0, 0, 0, 1]
+], dtype=complex)
+
+class MPSState:
+    def __init__(self, tensors: list[npt.NDArray], max_bond: int | None = None,
+                 cutoff: float = 1e-10, dtype: npt.DTypeLike = np.complex64,
+                 seed: 'int | np.random.Generator | None' = None):
+        """
+        Represents a quantum state as a matrix product state (MPS):
+        a chain of site tensors of shape (chi_l, 2, chi_r), one per
+        qubit. Memory grows as O(n * chi^2) rather than O(2^n), so
+        circuits that create little entanglement (such as
+        teleportation) scale to many more qubits than `QuantumState`.
+        The first tensor holds the most significant qubit, matching
+        the order of `QuantumState.from_qubits`
+
+        Args:
+            tensors (list[npt.NDArray]): the site tensors
+            max_bond (int | None): the largest bond dimension kept after a two-qubit gate; unbounded if None
+            cutoff (float): singular values below `cutoff` times the largest are discarded
+            dtype (npt.DTypeLike): the complex dtype used to store the tensors
+            seed (int | np.random.Generator | None): seeds the generator used for measurements; fresh entropy if None
+
+        Raises:
+            Exception: each tensor must have shape (chi_l, 2, chi_r) and neighbouring bonds must match
+        """
+        tensors = [np.array(t, dtype=dtype) for t in tensors]
+        for i, t in enumerate(tensors):
+            if t.ndim != 3 or t.shape[1] != 2:
+                raise Exception(f"Site tensor {i} must have shape (chi_l, 2, chi_r)")
+            if i > 0 and tensors[i - 1].shape[2] != t.shape[0]:
+                raise Exception(f"The bond between sites {i - 1} and {i} does not match")
+
+        self.tensors = tensors
+        self.n_qubits = len(tensors)
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self._rng = np.random.default_rng(seed)
+
+    def __str__(self):
+        return f"MPSState(n_qubits={self.n_qubits}, bond_dims={self.bond_dims()})"
+
+    @classmethod
+    def from_qubits(self, *qubits: npt.NDArray, **kwargs) -> 'MPSState':
+        """
+        Constructs a product state from a list of n single qubits,
+        each stored as a site tensor with bond dimension 1
+
+        Args:
+            kwargs: passed to the `MPSState` constructor
+
+        Raises:
+            Exception: each qubit must be a normalized vector of length 2
+
+        Returns:
+            MPSState: an instance of the `MPSState` class
+        """
+        tensors = []
+        for qubit in qubits:
+            if len(qubit) != 2 or abs(1 - e_norm(qubit)) > 1e-5:
+                raise Exception("Each qubit must be a normalized vector of length 2")
+            tensors.append(np.reshape(qubit, (1, 2, 1)))
+        return self(tensors, **kwargs)
+
+    @classmethod
+    def from_statevector(self, statevector: 'npt.NDArray | QuantumState', **kwargs) -> 'MPSState':
+        """
+        Decomposes a statevector into an MPS through
+        successive singular value decompositions
+
+        Args:
+            statevector (npt.NDArray | QuantumState): the quantum state
+            kwargs: passed to the `MPSState` constructor
+
+        Raises:
+            Exception: the state vector's length must be a power of 2
+            Exception: the Euclidean norm of the state must be 1
+
+        Returns:
+            MPSState: an instance of the `MPSState` class
+        """
+        if isinstance(statevector, QuantumState):
+            statevector = statevector.to_numpy()
+        if not is_pow_of_2(len(statevector)):
+            raise Exception("The length of the statevector must be a power of 2")
+        if abs(1 - e_norm(statevector)) > 1e-5:
+            raise Exception("The Euclidean norm of the state must be 1")
+
+        n = round(np.log2(len(statevector)))
+        tensors = []
+        rest = np.asarray(statevector, dtype=complex).reshape(1, -1)
+        for _ in range(n - 1):
+            chi = rest.shape[0]
+            u, s, vh = np.linalg.svd(rest.reshape(chi * 2, -1), full_matrices=False)
+            keep = max(1, int(np.sum(s > 1e-12 * s[0])))
+            tensors.append(u[:, :keep].reshape(chi, 2, keep))
+            rest = s[:keep, None] * vh[:keep]
+        tensors.append(rest.reshape(-1, 2, 1))
+        return self(tensors, **kwargs)
+
+    def add_qubit(self, qubit: 'npt.NDArray | QuantumState | MPSState'):
+        """
+        Adds qubits to the end of the chain using the tensor product
+
+        Args:
+            qubit (npt.NDArray | QuantumState | MPSState): the qubit(s) to be added to the quantum state
+        """
+        if not isinstance(qubit, MPSState):
+            qubit = MPSState.from_statevector(qubit)
+        self.tensors += [t.astype(self.tensors[0].dtype) for t in qubit.tensors]
+        self.n_qubits += qubit.n_qubits
+
+    def bond_dims(self) -> list[int]:
+        """
+        Returns the bond dimensions between neighbouring sites
+
+        Returns:
+            list[int]: the n - 1 bond dimensions
+        """
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+    def measure(self, index: int) -> int:
+        """
+        Performs a partial measurement on a quantum state,
+        updating the state according to the measurement outcome
+
+        Args:
+            index (int): the index of the qubit to be measured
+
+        Raises:
+            Exception: the index must correspond to an existing qubit
+
+        Returns:
+            int: the result of the measurement
+        """
+        site = self.__site(index)
+        probs = self.__outcome_weights(site)
+        result = 0 if self._rng.random() < probs[0] / sum(probs) else 1
+
+        t = self.tensors[site]
+        t[:, 1 - result] = 0
+        t /= np.sqrt(probs[result])
+        return result
+
+    def sample(self, index: int, n_shots: int) -> npt.NDArray:
+        """
+        Simulates measuring the specified qubit on `n_shots`
+        copies of the quantum state, without collapsing it
+
+        Args:
+            index (int): the index of the qubit to be measured
+            n_shots (int): the number of measurements
+
+        Raises:
+            Exception: the index must correspond to an existing qubit
+
+        Returns:
+            npt.NDArray: the result of each measurement (0, 1)
+        """
+        probs = self.__outcome_weights(self.__site(index))
+        return (self._rng.random(n_shots) >= probs[0] / sum(probs)).astype(int)
+
+    def to_numpy(self) -> npt.NDArray:
+        """
+        Contracts the chain into a statevector. This takes
+        O(2^n) memory, so it is only practical for small states
+
+        Returns:
+            npt.NDArray: the statevector
+        """
+        psi = np.ones((1, 1), dtype=self.tensors[0].dtype)
+        for t in self.tensors:
+            psi = contract('pa,aib->pib', psi, t).reshape(-1, t.shape[2])
+        return psi.reshape(-1)
+
+    def CNOT(self, control: int, target: int):
+        """
+        Performs a controlled NOT gate on two specified qubits,
+        leaving all other qubits unchanged. If the qubits are
+        not neighbours in the chain, the target is swapped next
+        to the control, the gate is applied, and it is swapped back
+
+        Args:
+            control (int): the index of the control qubit
+            target (int): the index of the target qubit
+
+        Raises:
+            Exception: the indices must correspond to existing qubits
+            Exception: the control and target must be different qubits
+        """
+        c, t = self.__site(control), self.__site(target)
+        if c == t:
+            raise Exception("The control and target of a CNOT must be different qubits")
+        step = 1 if t > c else -1
+        swaps = []
+        while abs(t - c) > 1:
+            left = min(t, t - step)
+            self.__apply_two_site(left, SWAP_MATRIX)
+            swaps.append(left)
+            t -= step
+
+        cnot = CNOT_MATRIX
+        if t < c:
+            # Reorder the gate's indices so the left site comes first
+            cnot = cnot.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+        self.__apply_two_site(min(c, t), cnot)
+
+        for left in reversed(swaps):
+            self.__apply_two_site(left, SWAP_MATRIX)
+
+    def X(self, index: int):
+        """
+        Performs a bit flip on the specified qubit,
+        leaving all other qubits unchanged
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        self.__apply_one_site(index, X_MATRIX)
+
+    def Z(self, index: int):
+        """
+        Performs a phase flip on the specified qubit,
+        leaving all other qubits unchanged
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        self.__apply_one_site(index, Z_MATRIX)
+
+    def H(self, index: int):
+        """
+        Performs a Hadamard gate on the specified qubit,
+        leaving all other qubits unchanged
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        self.__apply_one_site(index, H_MATRIX)
+
+    def T(self, index: int):
+        """
+        Performs a T gate on the specified qubit,
+        leaving all other qubits unchanged.
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        self.__apply_one_site(index, T_MATRIX)
+
+    def Tdg(self, index: int):
+        """
+        Performs a T-dagger gate on the specified qubit,
+        leaving all other qubits unchanged. T-dagger is the
+        conjugate-transpose of the T gate.
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        self.__apply_one_site(index, TDG_MATRIX)
+
+    def __site(self, index: int) -> int:
+        """
+        Converts a qubit index into its position in the chain.
+        Qubit 0 is the least significant, so it is the last site
+
+        Args:
+            index (int): the index of the qubit
+
+        Raises:
+            Exception: the index must correspond to an existing qubit
+
+        Returns:
+            int: the position of the site tensor
+        """
+        if index < 0 or index >= self.n_qubits:
+            raise Exception(f"Qubit index {index} is out of range for {self.n_qubits} qubits")
+        return self.n_qubits - index - 1
+
+    def __outcome_weights(self, site: int) -> list[float]:
+        """
+        Returns the unnormalized weights of the outcomes 0 and 1
+        at the specified site, found by contracting the chain with
+        its conjugate from both ends towards the site
+
+        Args:
+            site (int): the position of the site tensor
+
+        Returns:
+            list[float]: the weights of the outcomes 0 and 1
+        """
+        left = np.ones((1, 1))
+        for t in self.tensors[:site]:
+            left = contract('ab,aic,bid->cd', left, t.conj(), t)
+        right = np.ones((1, 1))
+        for t in reversed(self.tensors[site + 1:]):
+            right = contract('aic,bid,cd->ab', t.conj(), t, right)
+
+        t = self.tensors[site]
+        return [contract('ab,ac,bd,cd->', left, t[:, i].conj(), t[:, i], right).real for i in (0, 1)]
+
+    def __apply_one_site(self, index: int, operation: npt.NDArray):
+        """
+        Applies a 2x2 operation to the physical index
+        of a single site tensor
+
+        Args:
+            index (int): the index of the target qubit
+            operation (npt.NDArray): the operation to be performed on the target qubit
+        """
+        site = self.__site(index)
+        t = self.tensors[site]
+        self.tensors[site] = contract('ij,ajb->aib', operation.astype(t.dtype), t)
+
+    def __apply_two_site(self, site: int, operation: npt.NDArray):
+        """
+        Applies a 4x4 operation to two neighbouring sites. The
+        pair is contracted into a single tensor, the operation
+        is applied, and the result is split back into two sites
+        with an SVD, truncating small singular values and
+        limiting the bond dimension to `max_bond`
+
+        Args:
+            site (int): the position of the left site; the right site is `site + 1`
+            operation (npt.NDArray): the operation, with the left site as the most significant qubit
+        """
+        a, b = self.tensors[site], self.tensors[site + 1]
+        chi_l, chi_r = a.shape[0], b.shape[2]
+        gate = operation.astype(a.dtype).reshape(2, 2, 2, 2)
+        theta = contract('ijkl,akb,blc->aijc', gate, a, b).reshape(chi_l * 2, 2 * chi_r)
+
+        u, s, vh = np.linalg.svd(theta, full_matrices=False)
+        keep = max(1, int(np.sum(s > self.cutoff * s[0])))
+        if self.max_bond is not None:
+            keep = min(keep, self.max_bond)
+        kept = s[:keep] * (np.linalg.norm(s) / np.linalg.norm(s[:keep]))
+
+        self.tensors[site] = u[:, :keep].reshape(chi_l, 2, keep)
+        self.tensors[site + 1] = (kept[:, None] * vh[:keep]).astype(a.dtype).reshape(keep, 2, chi_r)
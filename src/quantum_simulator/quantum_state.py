@@ -1,69 +1,259 @@
+import os
 import numpy as np
 import numpy.typing as npt
-from random import random
-from .utils import is_pow_of_2, e_norm
+from concurrent.futures import ThreadPoolExecutor
+from .utils import abs_squared, is_pow_of_2, e_norm
+from .gate import Gate
+
+INV_SQRT2 = 1 / np.sqrt(2)
+
+IDENTITY = np.identity(2, dtype=complex)
+X_MATRIX = np.array([
+    [0, 1],
+    [1, 0]
+], dtype=complex)
+Z_MATRIX = np.array([
+    [1, 0],
+    [0, -1]
+], dtype=complex)
+H_MATRIX = np.array([
+    [1, 1],
+    [1, -1]
+], dtype=complex) * INV_SQRT2
+T_MATRIX = np.array([
+    [1, 0],
+    [0, complex(INV_SQRT2, INV_SQRT2)]
+], dtype=complex)
+TDG_MATRIX = T_MATRIX.conj().T
+
+# Statevectors at least this long are updated by several threads
+# when Numba is unavailable. NumPy releases the GIL inside its
+# ufuncs, so each thread streams through its own block of the state
+PARALLEL_THRESHOLD = 1 << 16
+N_THREADS = os.cpu_count() or 1
+_executor = None
+
+# Statevectors at least this long use the Numba kernels when numba is
+# installed. The kernels are cached on disk, so compilation is paid once;
+# below the threshold NumPy's per-call overhead is already negligible and
+# small circuits never import numba
+NUMBA_THRESHOLD = 1 << 8
+
+def _load_kernels():
+    """
+    Imports the Numba kernels on first use
+
+    Returns:
+        module | None: the `_kernels` module, or None if numba is not installed
+    """
+    from . import _kernels
+    return _kernels if _kernels.NUMBA_AVAILABLE else None
+
+def _run_blocks(kernel, blocks):
+    """
+    Runs `kernel(*block)` for every block, in parallel
+    on a shared thread pool
+
+    Args:
+        kernel (Callable): the function to run on each block
+        blocks (Iterable[tuple]): the arguments for each call
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=N_THREADS)
+    for future in [_executor.submit(kernel, *block) for block in blocks]:
+        future.result()
+
+def _x_block(a: npt.NDArray, b: npt.NDArray, tmp: npt.NDArray, _: npt.NDArray):
+    """
+    Swaps the |0> and |1> amplitudes of a block in place
+
+    Args:
+        a (npt.NDArray): the amplitudes where the target qubit is 0
+        b (npt.NDArray): the amplitudes where the target qubit is 1
+        tmp (npt.NDArray): a scratch block the same shape as `a`
+        _ (npt.NDArray): unused
+    """
+    np.copyto(tmp, a)
+    a[:] = b
+    b[:] = tmp
+
+def _z_block(a: npt.NDArray, b: npt.NDArray, _: npt.NDArray, __: npt.NDArray):
+    """
+    Negates the |1> amplitudes of a block in place
+
+    Args:
+        a (npt.NDArray): the amplitudes where the target qubit is 0; unchanged
+        b (npt.NDArray): the amplitudes where the target qubit is 1
+        _ (npt.NDArray): unused
+        __ (npt.NDArray): unused
+    """
+    np.negative(b, out=b)
+
+def _h_block(a: npt.NDArray, b: npt.NDArray, a_new: npt.NDArray, _: npt.NDArray, scale: float):
+    """
+    Applies a Hadamard gate to a block in place, mapping
+    each amplitude pair (a, b) to ((a + b) * scale, (a - b) * scale)
+
+    Args:
+        a (npt.NDArray): the amplitudes where the target qubit is 0
+        b (npt.NDArray): the amplitudes where the target qubit is 1
+        a_new (npt.NDArray): a scratch block the same shape as `a`
+        _ (npt.NDArray): unused
+        scale (float): the normalization factor, 1/sqrt(2)
+    """
+    np.add(a, b, out=a_new)
+    np.subtract(a, b, out=b)
+    np.multiply(a_new, scale, out=a)
+    b *= scale
+
+def _operator_block(a: npt.NDArray, b: npt.NDArray, a_new: npt.NDArray, tmp: npt.NDArray,
+                    g00: complex, g01: complex, g10: complex, g11: complex):
+    """
+    Applies the 2x2 operation [[g00, g01], [g10, g11]]
+    in place to the amplitude pairs of a block
+
+    Args:
+        a (npt.NDArray): the amplitudes where the target qubit is 0
+        b (npt.NDArray): the amplitudes where the target qubit is 1
+        a_new (npt.NDArray): a scratch block the same shape as `a`
+        tmp (npt.NDArray): a second scratch block the same shape as `a`
+        g00, g01, g10, g11 (complex): the entries of the operation
+    """
+    np.multiply(a, g00, out=a_new)
+    np.multiply(b, g01, out=tmp)
+    a_new += tmp
+    np.multiply(a, g10, out=tmp)
+    b *= g11
+    b += tmp
+    a[:] = a_new
 
 class QuantumState:
-    def __init__(self, statevector: npt.NDArray):
+    def __init__(self, statevector: npt.NDArray, dtype: npt.DTypeLike = np.complex64, copy: bool = False,
+                 seed: 'int | np.random.Generator | None' = None):
         """
-        Represents a quantum state through a statevector
+        Represents a quantum state through a statevector.
+        Amplitudes are stored as complex64 by default, which
+        halves memory use compared to complex128; pass
+        `dtype=np.complex128` when double precision is needed.
+        A contiguous array of the matching dtype is used as the
+        statevector without copying, so gates will update it in
+        place; pass `copy=True` to keep the input unchanged
 
         Args:
             statevector (npt.NDArray): the initial quantum state
+            dtype (npt.DTypeLike): the complex dtype used to store the amplitudes
+            copy (bool): whether to always copy the statevector
+            seed (int | np.random.Generator | None): seeds the generator used for measurements; fresh entropy if None
 
         Raises:
             Exception: the state vector's length must be a power of 2
             Exception: the Euclidean norm of the state must be 1
         """
+        self.__install(statevector, dtype, copy)
+        self._rng = np.random.default_rng(seed)
 
-        if not is_pow_of_2(len(statevector)):
-            raise Exception("The length of the statevector must be a power of 2")
-        if abs(1 - e_norm(statevector)) > 1e-5:
-            raise Exception("The Euclidean norm of the state must be 1")
-        
-        self.state = np.array(statevector, dtype=complex)
-        self.n_qubits = round(np.log2(len(statevector)))
+    @property
+    def state(self) -> npt.NDArray:
+        """
+        The statevector, with any deferred gates applied
+
+        Returns:
+            npt.NDArray: the statevector
+        """
+        self.__flush()
+        return self._state
+
+    @state.setter
+    def state(self, statevector: npt.NDArray):
+        """
+        Replaces the statevector, discarding any deferred gates.
+        The amplitudes keep the current dtype, and a contiguous
+        array of that dtype is used without copying
+
+        Args:
+            statevector (npt.NDArray): the new quantum state
+
+        Raises:
+            Exception: the state vector's length must be a power of 2
+            Exception: the Euclidean norm of the state must be 1
+        """
+        self.__install(statevector, self._state.dtype, copy=False)
 
     def __str__(self):
-        return self.state.round(4).__str__()
+        self.__flush()
+        return self._state.round(4).__str__()
     
     def __getitem__(self, index):
-        return self.state[index]
+        self.__flush()
+        return self._state[index]
 
     def __len__(self):
-        return self.state.size
+        return self._state.size
     
     @classmethod
-    def from_qubits(self, *qubits: 'npt.NDArray | QuantumState') -> 'QuantumState':
+    def from_qubits(self, *qubits: 'npt.NDArray | QuantumState', dtype: npt.DTypeLike = np.complex64,
+                    seed: 'int | np.random.Generator | None' = None) -> 'QuantumState':
         """
-        Constructs a quantum state from a list of n qubits
+        Constructs a quantum state from a list of n qubits.
+        The tensor product is written into a single buffer of
+        the final size, and a product of basis states is built
+        by setting its one nonzero amplitude directly
+
+        Args:
+            dtype (npt.DTypeLike): the complex dtype used to store the amplitudes
+            seed (int | np.random.Generator | None): seeds the generator used for measurements; fresh entropy if None
 
         Returns:
             QuantumState: an instance of the `QuantumState` class
         """
-        statevector = np.array([1], dtype=complex)
-        for qubit in qubits:
-            if isinstance(qubit, QuantumState):
-                statevector = np.kron(statevector, qubit.to_numpy())
-            else:
-                statevector = np.kron(statevector, qubit)
-
-        return self(statevector)
+        vectors = [q.to_numpy() if isinstance(q, QuantumState) else np.asarray(q) for q in qubits]
+        size = int(np.prod([len(v) for v in vectors]))
+        nonzero = [np.flatnonzero(v) for v in vectors]
+
+        if all(len(nz) == 1 for nz in nonzero):
+            statevector = np.zeros(size, dtype=dtype)
+            index, amplitude = 0, 1
+            for v, nz in zip(vectors, nonzero):
+                index = index * len(v) + nz[0]
+                amplitude *= v[nz[0]]
+            statevector[index] = amplitude
+            return self(statevector, dtype=dtype, seed=seed)
+
+        # The product of the last qubits fills the tail of the buffer. Each
+        # earlier qubit extends it by writing copies scaled by all but its last
+        # entry in front of the tail, then scaling the tail by its last entry
+        statevector = np.empty(size, dtype=dtype)
+        statevector[-1] = 1
+        length = 1
+        for v in reversed(vectors):
+            m = len(v)
+            tail = statevector[size - length:]
+            front = statevector[size - length * m:size - length].reshape(m - 1, length)
+            np.multiply(v[:-1, None], tail, out=front)
+            tail *= v[-1]
+            length *= m
+
+        return self(statevector, dtype=dtype, seed=seed)
 
     def add_qubit(self, qubit: 'npt.NDArray | QuantumState'):
         """
-        Adds a qubit to a quantum state using the tensor product
+        Adds a qubit to a quantum state using the tensor product.
+        The state keeps its dtype regardless of the qubit's dtype
 
         Args:
             qubit (npt.NDArray | QuantumState): the qubit to be added to the quantum state
         """
+        self.__flush()
         if isinstance(qubit, QuantumState):
             q = qubit.to_numpy()
-            self.state = np.kron(self.state, q)
+            self._state = np.kron(self._state, q).astype(self._state.dtype, copy=False)
             self.n_qubits += round(np.log2(len(q)))
         else:
-            self.state = np.kron(self.state, qubit)
+            self._state = np.kron(self._state, qubit).astype(self._state.dtype, copy=False)
             self.n_qubits += round(np.log2(len(qubit)))
+        self._scratch = np.empty_like(self._state)
+        self.__reset_index_cache()
     
     def measure(self, index: int) -> int:
         """
@@ -79,23 +269,62 @@ class QuantumState:
         Returns:
             int: the result of the measurement
         """
-        if index < 0 or index >= self.n_qubits:
-            raise Exception(f"Qubit index {index} is out of range for {self.n_qubits} qubits")
+        prob_0 = self.__prob_0(index)
+        result = 0 if self._rng.random() < prob_0 else 1
+
+        a, b = self.__split_pairs(index)
+        kept, discarded = (a, b) if result == 0 else (b, a)
+        discarded[:] = 0
+        norm = np.sqrt(np.sum(abs_squared(kept), dtype=np.float64))
+        if norm > 0:
+            kept /= norm
+        return result
 
-        index = self.n_qubits - index - 1
-        probs = np.abs(np.square(self.state))
+    def sample(self, index: int, n_shots: int) -> npt.NDArray:
+        """
+        Simulates measuring the specified qubit on `n_shots`
+        copies of the quantum state, without collapsing it.
+        The outcome probability is computed once and all
+        shots are drawn in a single call
 
-        prob_0 = sum(probs[i] for i in self.get_qubit_indices(index, 0))
-        result = 0 if random() < prob_0 else 1
+        Args:
+            index (int): the index of the qubit to be measured
+            n_shots (int): the number of measurements
 
-        indices = self.get_qubit_indices(index, result)
-        mask = np.zeros_like(self.state)
-        mask[indices] = 1
-        self.state *= mask
-        self.state /= np.sqrt(sum(probs[indices]))
-        return result
+        Raises:
+            Exception: the index must correspond to an existing qubit
+
+        Returns:
+            npt.NDArray: the result of each measurement (0, 1)
+        """
+        prob_0 = self.__prob_0(index)
+        return (self._rng.random(n_shots) >= prob_0).astype(int)
 
-    def get_qubit_indices(self, index: int, outcome: int) -> list[int]:
+    def __prob_0(self, index: int) -> float:
+        """
+        Returns the probability of measuring 0 on
+        the qubit of the specified index. Both halves are
+        summed in double precision and the result is divided
+        by their total, so a qubit that is exactly |0> or |1>
+        gives exactly 1 or 0 even at single precision
+
+        Args:
+            index (int): the index of the qubit
+
+        Raises:
+            Exception: the index must correspond to an existing qubit
+
+        Returns:
+            float: the probability of the outcome 0
+        """
+        self.__check_index(index)
+        self.__flush()
+        a, b = self.__split_pairs(index)
+        weight_0 = np.sum(abs_squared(a), dtype=np.float64)
+        weight_1 = np.sum(abs_squared(b), dtype=np.float64)
+        return weight_0 / (weight_0 + weight_1)
+
+    def get_qubit_indices(self, index: int, outcome: int) -> npt.NDArray:
         """
         Retrieves the indices of the statevector 
         that contain the specified outcome
@@ -106,14 +335,10 @@ class QuantumState:
             outcome (int): the qubit's desired state (0, 1)
 
         Returns:
-            list[int]: the indices of the statevector
-        """
-        indices = []
-        for i in range(len(self.state)):
-            bits = format(i, f'0{self.n_qubits}b')
-            if int(bits[index]) == outcome:
-                indices.append(i)
-        return indices
+            npt.NDArray: the indices of the statevector
+        """
+        k = self.n_qubits - 1 - index
+        return np.nonzero(self.__bits(k) == outcome)[0]
     
     def CNOT(self, control: int, target: int):
         """
@@ -123,20 +348,35 @@ class QuantumState:
         Args:
             control (int): the index of the control qubit
             target (int): the index of the target qubit
+
+        Raises:
+            Exception: the indices must correspond to existing qubits
+            Exception: the control and target must be different qubits
         """
-        control = self.n_qubits - control - 1
-        target = self.n_qubits - target - 1
-        new_state = np.zeros_like(self.state)
-        for i in range(len(self.state)):
-            b = format(i, f'0{self.n_qubits}b')
-            if b[control] == '1':
-                flipped = list(b)
-                flipped[target] = '0' if b[target] == '1' else '1'
-                j = int(''.join(flipped), 2)
-                new_state[j] += self.state[i]
-            else:
-                new_state[i] = self.state[i]
-        self.state = new_state
+        self.__check_index(control)
+        self.__check_index(target)
+        if control == target:
+            raise Exception("The control and target of a CNOT must be different qubits")
+
+        self.__flush()
+        kernels = self.__kernels()
+        if kernels is not None:
+            kernels.apply_cnot(self._state, control, target)
+            return
+
+        flip = self.__indices()[self.__bits(control) > self.__bits(target)]
+        partner = flip | (1 << target)
+        tmp = self._scratch[:flip.size]
+
+        def swap(flip, partner, tmp):
+            np.take(self._state, flip, out=tmp)
+            self._state[flip] = self._state[partner]
+            self._state[partner] = tmp
+
+        if self._state.size < PARALLEL_THRESHOLD or N_THREADS == 1:
+            swap(flip, partner, tmp)
+        else:
+            _run_blocks(swap, zip(*(np.array_split(v, N_THREADS) for v in (flip, partner, tmp))))
         
     def X(self, index: int):
         """
@@ -146,13 +386,7 @@ class QuantumState:
         Args:
             index (int): the index of the target qubit
         """
-        index = self.n_qubits - index - 1
-        x = np.array([
-            [0, 1],
-            [1, 0]
-        ])
-        operator = self.__expand_operator(index, x)
-        self.state = operator @ self.state
+        self.__queue(index, X_MATRIX)
 
     def Z(self, index: int):
         """
@@ -162,13 +396,7 @@ class QuantumState:
         Args:
             index (int): the index of the target qubit
         """
-        index = self.n_qubits - index - 1
-        z = np.array([
-            [1, 0],
-            [0, -1]
-        ])
-        operator = self.__expand_operator(index, z)
-        self.state = operator @ self.state
+        self.__queue(index, Z_MATRIX)
 
     def H(self, index: int):
         """
@@ -178,13 +406,7 @@ class QuantumState:
         Args:
             index (int): the index of the target qubit
         """
-        index = self.n_qubits - index - 1
-        h = np.array([
-            [1, 1],
-            [1, -1]
-        ]) / np.sqrt(2)
-        operator = self.__expand_operator(index, h)
-        self.state = operator @ self.state
+        self.__queue(index, H_MATRIX)
 
     def T(self, index: int):
         """
@@ -194,13 +416,7 @@ class QuantumState:
         Args:
             index (int): the index of the target qubit
         """
-        index = self.n_qubits - index - 1
-        t = np.array([
-            [1, 0],
-            [0, complex(1/np.sqrt(2), 1/np.sqrt(2))]
-        ], dtype=complex)
-        operator = self.__expand_operator(index, t)
-        self.state = operator @ self.state
+        self.__queue(index, T_MATRIX)
     
     def Tdg(self, index: int):
         """
@@ -211,41 +427,315 @@ class QuantumState:
         Args:
             index (int): the index of the target qubit
         """
-        index = self.n_qubits - index - 1
-        t = np.array([
-            [1, 0],
-            [0, complex(1/np.sqrt(2), -1/np.sqrt(2))]
-        ], dtype=complex)
-        operator = self.__expand_operator(index, t)
-        self.state = operator @ self.state
+        self.__queue(index, TDG_MATRIX)
+
+    def apply_gate(self, gate: 'Gate | npt.NDArray', *indices: int):
+        """
+        Applies a k-qubit gate to the specified qubits,
+        leaving all other qubits unchanged. The first index
+        corresponds to the most significant qubit of the
+        gate's matrix, e.g. `apply_gate(cnot, control, target)`
+
+        Args:
+            gate (Gate | npt.NDArray): the 2^k x 2^k gate to be applied
+            indices (int): the indices of the k target qubits
+
+        Raises:
+            Exception: the indices must correspond to distinct, existing qubits
+            Exception: the gate's dimensions must match the number of indices
+        """
+        operation = gate.to_numpy() if isinstance(gate, Gate) else np.asarray(gate)
+        k = len(indices)
+        if len(set(indices)) != k or any(i < 0 or i >= self.n_qubits for i in indices):
+            raise Exception(f"Qubit indices {indices} must be distinct and in range for {self.n_qubits} qubits")
+        if operation.shape != (1 << k, 1 << k):
+            raise Exception(f"A gate acting on {k} qubits must be a {1 << k}x{1 << k} matrix")
+
+        if k == 1:
+            self.__queue(indices[0], np.array(operation, dtype=complex))
+        else:
+            self.__flush()
+            self._apply_k_qubit(operation, list(indices))
+
+    def _apply_k_qubit(self, gate: npt.NDArray, qubits: list[int]):
+        """
+        Applies a 2^k x 2^k gate to k qubits by viewing the
+        statevector as a rank-n tensor and contracting only
+        the axes of the target qubits, which takes
+        O(2^(n-k) * 4^k) work instead of O(4^n). Gates on
+        three or more qubits are applied by moving the target
+        axes to the front and using a single matrix product,
+        with the statevector and scratch buffer holding the
+        intermediate results so no temporaries are allocated
+
+        Args:
+            gate (npt.NDArray): the gate to be applied
+            qubits (list[int]): the indices of the target qubits
+        """
+        n, k = self.n_qubits, len(qubits)
+        gate = np.asarray(gate, dtype=self._state.dtype)
+        tensor = self._state.reshape([2] * n)
+        out = self._scratch.reshape([2] * n)
+        # Qubit i is bit i of the index, so it is axis n - 1 - i of the tensor
+        axes = [n - 1 - q for q in qubits]
+
+        if k < 3:
+            gate_t = gate.reshape([2] * (2 * k))
+            new_axes = list(range(n, n + k))
+            result_axes = list(range(n))
+            for axis, new_axis in zip(axes, new_axes):
+                result_axes[axis] = new_axis
+            np.einsum(gate_t, new_axes + axes, tensor, list(range(n)), result_axes, out=out, optimize=True)
+        else:
+            # Gather the target axes to the front in the scratch buffer,
+            # multiply into the statevector's memory, then scatter the
+            # result back to its natural order in the scratch buffer
+            front = list(range(k))
+            unfolded = self._scratch.reshape(1 << k, -1)
+            result = self._state.reshape(1 << k, -1)
+            np.copyto(out, np.moveaxis(tensor, axes, front))
+            np.matmul(gate, unfolded, out=result)
+            np.copyto(np.moveaxis(out, axes, front), tensor)
+        np.copyto(self._state, self._scratch)
+
+    def __kernels(self):
+        """
+        Returns the Numba kernels if the statevector is
+        large enough to benefit from them
+
+        Returns:
+            module | None: the `_kernels` module, or None to use NumPy
+        """
+        if self._state.size < NUMBA_THRESHOLD:
+            return None
+        return _load_kernels()
+
+    def __install(self, statevector: npt.NDArray, dtype: npt.DTypeLike, copy: bool):
+        """
+        Validates a statevector and makes it the current state,
+        resetting the buffers and caches that depend on its size
+
+        Args:
+            statevector (npt.NDArray): the quantum state
+            dtype (npt.DTypeLike): the complex dtype used to store the amplitudes
+            copy (bool): whether to always copy the statevector
+
+        Raises:
+            Exception: the state vector's length must be a power of 2
+            Exception: the Euclidean norm of the state must be 1
+        """
+        if not is_pow_of_2(len(statevector)):
+            raise Exception("The length of the statevector must be a power of 2")
+        if abs(1 - e_norm(statevector)) > 1e-5:
+            raise Exception("The Euclidean norm of the state must be 1")
+
+        if copy:
+            self._state = np.array(statevector, dtype=dtype)
+        else:
+            self._state = np.ascontiguousarray(statevector, dtype=dtype)
+        self.n_qubits = round(np.log2(len(statevector)))
+        self._scratch = np.empty_like(self._state)
+        self._pending = {}
+        self.__reset_index_cache()
+
+    def __check_index(self, index: int):
+        """
+        Ensures that the index corresponds to an existing qubit
+
+        Args:
+            index (int): the index of the qubit
+
+        Raises:
+            Exception: the index must correspond to an existing qubit
+        """
+        if index < 0 or index >= self.n_qubits:
+            raise Exception(f"Qubit index {index} is out of range for {self.n_qubits} qubits")
+
+    def __reset_index_cache(self):
+        """
+        Clears the cached index array and bit masks. Must be
+        called whenever the length of the statevector changes
+        """
+        self._idx = None
+        self._bit_cache = {}
+
+    def __indices(self) -> npt.NDArray:
+        """
+        Returns the indices of the statevector, building
+        them on first use and reusing them afterwards
 
-    def __expand_operator(self, index: int, operation: npt.NDArray) -> npt.NDArray:
+        Returns:
+            npt.NDArray: the array [0, 1, ..., N-1]
+        """
+        if self._idx is None:
+            self._idx = np.arange(self._state.size, dtype=np.intp)
+        return self._idx
+
+    def __bits(self, k: int) -> npt.NDArray:
+        """
+        Returns the value of bit `k` of every index of the
+        statevector, building the mask on first use and
+        reusing it afterwards
+
+        Args:
+            k (int): the bit position
+
+        Returns:
+            npt.NDArray: an array of 0s and 1s the length of the statevector
+        """
+        if k not in self._bit_cache:
+            self._bit_cache[k] = ((self.__indices() >> k) & 1).astype(np.uint8)
+        return self._bit_cache[k]
+
+    def __queue(self, index: int, operation: npt.NDArray):
         """
-        Expands an operator to NxN dimensions where N is the 
-        length of the statevector. The new operator will only
-        affect the qubit of the specified index, leaving all
-        other qubits unchanged. It does this by finding the 
-        tensor products of identity matrices and the operation,
-        where the order corresponds to the specified index
+        Defers a 2x2 operation on the qubit of the specified
+        index. Consecutive operations on the same qubit are
+        fused into a single matrix, so they cost one pass over
+        the statevector when the queue is flushed
 
         Args:
             index (int): the index of the target qubit
             operation (npt.NDArray): the operation to be performed on the target qubit
 
-        Returns:
-            npt.NDArray: the new expanded operator
+        Raises:
+            Exception: the index must correspond to an existing qubit
         """
-        i_2 = np.identity(2)
-        if index == 0:
-            operator = operation
+        self.__check_index(index)
+        if index in self._pending:
+            self._pending[index] = operation @ self._pending[index]
         else:
-            operator = i_2
-        for i in range(1, self.n_qubits):
-            if i == index:
-                operator = np.kron(operator, operation)
-            else:
-                operator = np.kron(operator, i_2)
-        return operator
+            self._pending[index] = operation
+
+    def __flush(self):
+        """
+        Applies every deferred single-qubit operation to the
+        statevector and clears the queue. Must be called before
+        the statevector is read or a multi-qubit operation is
+        applied. A lone X, Z or H uses its specialized kernel
+        and fused operations that are exactly the identity, up to
+        rounding error, are skipped
+        """
+        pending, self._pending = self._pending, {}
+        for index, operation in pending.items():
+            if operation is X_MATRIX:
+                self.__apply_x(index)
+            elif operation is Z_MATRIX:
+                self.__apply_z(index)
+            elif operation is H_MATRIX:
+                self.__apply_h(index)
+            elif not np.allclose(operation, IDENTITY, rtol=0, atol=1e-12):
+                self.__apply_operator(index, operation)
+
+    def __apply_x(self, index: int):
+        """
+        Swaps each pair of amplitudes differing only
+        in the qubit of the specified index
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        kernels = self.__kernels()
+        if kernels is not None:
+            kernels.apply_x(self._state, index)
+            return
+
+        self.__for_each_block(index, _x_block)
+
+    def __apply_z(self, index: int):
+        """
+        Negates the amplitudes where the qubit
+        of the specified index is 1
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        kernels = self.__kernels()
+        if kernels is not None:
+            kernels.apply_z(self._state, index)
+            return
+
+        self.__for_each_block(index, _z_block)
+
+    def __apply_h(self, index: int):
+        """
+        Maps each pair of amplitudes (a, b) differing only in
+        the qubit of the specified index to (a + b, a - b) / sqrt(2)
+
+        Args:
+            index (int): the index of the target qubit
+        """
+        scale = self._state.real.dtype.type(INV_SQRT2)
+        kernels = self.__kernels()
+        if kernels is not None:
+            kernels.apply_h(self._state, index, scale)
+            return
+
+        self.__for_each_block(index, _h_block, scale)
+
+    def __split_pairs(self, index: int, buffer: npt.NDArray | None = None) -> tuple[npt.NDArray, npt.NDArray]:
+        """
+        Splits the statevector into two views holding the
+        amplitudes where the qubit of the specified index is
+        0 and 1 respectively. Element i of the first view is
+        paired with element i of the second view, differing
+        only in the target qubit. Writing to the views updates
+        the statevector in place
+
+        Args:
+            index (int): the index of the target qubit
+            buffer (npt.NDArray | None): a statevector-sized buffer to split instead of the statevector
+
+        Returns:
+            tuple[npt.NDArray, npt.NDArray]: the |0> and |1> views
+        """
+        if buffer is None:
+            buffer = self._state
+        stride = 1 << index
+        pairs = buffer.reshape(-1, 2, stride)
+        return pairs[:, 0, :], pairs[:, 1, :]
+
+    def __apply_operator(self, index: int, operation: npt.NDArray):
+        """
+        Applies a 2x2 operation to the qubit of the specified
+        index, leaving all other qubits unchanged. Rather than
+        expanding the operation to NxN dimensions, each pair of
+        amplitudes differing only in the target qubit is updated
+        in place, using the scratch buffer for intermediate values
+
+        Args:
+            index (int): the index of the target qubit
+            operation (npt.NDArray): the operation to be performed on the target qubit
+        """
+        (g00, g01), (g10, g11) = np.asarray(operation, dtype=self._state.dtype)
+        kernels = self.__kernels()
+        if kernels is not None:
+            kernels.apply_1q(self._state, g00, g01, g10, g11, index)
+            return
+
+        self.__for_each_block(index, _operator_block, g00, g01, g10, g11)
+
+    def __for_each_block(self, index: int, kernel, *args):
+        """
+        Calls `kernel(a, b, scratch_a, scratch_b, *args)` on the
+        pair-strided views of the statevector and scratch buffer
+        for the qubit of the specified index. Large statevectors
+        are split into independent blocks, one per thread,
+        along whichever axis of the views is longer
+
+        Args:
+            index (int): the index of the target qubit
+            kernel (Callable): the in-place update to perform
+            args: extra arguments passed to the kernel
+        """
+        views = self.__split_pairs(index) + self.__split_pairs(index, self._scratch)
+        if self._state.size < PARALLEL_THRESHOLD or N_THREADS == 1:
+            kernel(*views, *args)
+            return
+
+        axis = 0 if views[0].shape[0] >= views[0].shape[1] else 1
+        blocks = zip(*(np.array_split(v, N_THREADS, axis=axis) for v in views))
+        _run_blocks(kernel, (block + args for block in blocks))
 
     def to_numpy(self) -> npt.NDArray:
         """
@@ -254,4 +744,5 @@ class QuantumState:
         Returns:
             npt.NDArray: the statevector
         """
-        return self.state
+        self.__flush()
+        return self._state
@@ -13,7 +13,8 @@ def abs_squared(num: complex | float) -> npt.NDArray | float:
     Returns:
         npt.NDArray | float: the output
     """
-    return np.abs(np.square(num))
+    real, imag = np.real(num), np.imag(num)
+    return real * real + imag * imag
 
 def e_norm(vector: npt.NDArray) -> float | int:
     """
@@ -27,12 +28,18 @@ def e_norm(vector: npt.NDArray) -> float | int:
     Returns:
         float | int: the Euclidean norm
     """
-    return np.sum(abs_squared(vector))
+    vector = np.asarray(vector)
+    if vector.dtype in (np.complex128, np.float64):
+        return np.vdot(vector, vector).real
+    # Single-precision dot products accumulate too much rounding
+    # error on long vectors, so sum in double precision instead
+    return np.sum(abs_squared(vector), dtype=np.float64)
 
 def is_pow_of_2(length: int) -> bool:
     """
-    Determines of a number is a power of 2, assuming
-    that `length` > 0.
+    Determines of a number is a power of 2. A power of 2
+    has a single set bit, so clearing its lowest set bit
+    with `length & (length - 1)` leaves 0.
 
     Args:
         length (int): the input
@@ -40,6 +47,4 @@ def is_pow_of_2(length: int) -> bool:
     Returns:
         bool: true if the number is a power of 2; false otherwise
     """
-    while length % 2 == 0:
-        length //= 2
-    return length == 1
+    return length > 0 and (length & (length - 1)) == 0
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from quantum_simulator import QuantumState, MPSState
+
+def random_state(rng, n):
+    v = rng.normal(size=2**n) + 1j * rng.normal(size=2**n)
+    return v / np.linalg.norm(v)
+
+def test_from_statevector_round_trip():
+    rng = np.random.default_rng(0)
+    v = random_state(rng, 4)
+    assert np.allclose(MPSState.from_statevector(v, dtype=np.complex128).to_numpy(), v)
+
+def test_gates_match_dense_state():
+    rng = np.random.default_rng(1)
+    n = 5
+    v = random_state(rng, n)
+    dense = QuantumState(v.copy(), dtype=np.complex128)
+    mps = MPSState.from_statevector(v, dtype=np.complex128)
+    for _ in range(60):
+        gate = rng.choice(["X", "Z", "H", "T", "Tdg", "CNOT"])
+        q = int(rng.integers(n))
+        if gate == "CNOT":
+            target = int(rng.choice([i for i in range(n) if i != q]))
+            dense.CNOT(q, target)
+            mps.CNOT(q, target)
+        else:
+            getattr(dense, gate)(q)
+            getattr(mps, gate)(q)
+        assert np.allclose(dense.to_numpy(), mps.to_numpy())
+
+def test_measure_matches_dense_state():
+    rng = np.random.default_rng(2)
+    for seed in range(20):
+        v = random_state(rng, 3)
+        dense = QuantumState(v.copy(), dtype=np.complex128, seed=seed)
+        mps = MPSState.from_statevector(v, dtype=np.complex128, seed=seed)
+        assert dense.measure(1) == mps.measure(1)
+        assert np.allclose(dense.to_numpy(), mps.to_numpy())
+
+def test_add_qubit_matches_dense_state():
+    dense = QuantumState.from_qubits([1, 0], [1, 0], dtype=np.complex128)
+    mps = MPSState.from_qubits([1, 0], [1, 0], dtype=np.complex128)
+    for state in (dense, mps):
+        state.H(0)
+        state.CNOT(0, 1)
+        state.add_qubit(np.array([0.6, 0.8]))
+        state.CNOT(2, 0)
+    assert np.allclose(dense.to_numpy(), mps.to_numpy())
+
+def test_ghz_chain_keeps_bond_dimension_two():
+    mps = MPSState.from_qubits(*[np.array([1, 0])] * 60)
+    mps.H(0)
+    for i in range(59):
+        mps.CNOT(i, i + 1)
+    assert max(mps.bond_dims()) == 2
+    results = {mps.measure(i) for i in range(60)}
+    assert len(results) == 1
+
+@pytest.mark.parametrize("control, target", [(1, 1), (0, 0), (0, 3), (-1, 0)])
+def test_cnot_rejects_invalid_qubits(control, target):
+    mps = MPSState.from_qubits([1, 0], [0, 1], [1, 0])
+    with pytest.raises(Exception):
+        mps.CNOT(control, target)
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+import quantum_simulator.quantum_state as quantum_state
+from quantum_simulator import QuantumState
+from quantum_simulator.quantum_state import X_MATRIX, Z_MATRIX, H_MATRIX, T_MATRIX, TDG_MATRIX
+
+MATRICES = {"X": X_MATRIX, "Z": Z_MATRIX, "H": H_MATRIX, "T": T_MATRIX, "Tdg": TDG_MATRIX}
+
+def random_state(rng, n):
+    v = rng.normal(size=2**n) + 1j * rng.normal(size=2**n)
+    return v / np.linalg.norm(v)
+
+def random_unitary(rng, d):
+    q, r = np.linalg.qr(rng.normal(size=(d, d)) + 1j * rng.normal(size=(d, d)))
+    return q * (np.diag(r) / np.abs(np.diag(r)))
+
+def full_operator(gate, indices, n):
+    # Expands the gate into a sum of Kronecker products of 2x2 matrix
+    # units. Qubit i is bit i of the index, so the first factor is qubit n - 1
+    k = len(indices)
+    total = np.zeros((2**n, 2**n), dtype=complex)
+    for a in range(2**k):
+        for b in range(2**k):
+            factors = [np.identity(2)] * n
+            for j, q in enumerate(indices):
+                unit = np.zeros((2, 2))
+                unit[(a >> (k - 1 - j)) & 1, (b >> (k - 1 - j)) & 1] = 1
+                factors[n - 1 - q] = unit
+            term = factors[0]
+            for f in factors[1:]:
+                term = np.kron(term, f)
+            total += gate[a, b] * term
+    return total
+
+def test_state_applies_queued_gates():
+    q = QuantumState.from_qubits([1, 0], [1, 0], dtype=np.complex128)
+    q.H(0)
+    q.X(1)
+    expected = np.array([0, 0, 1, 1]) / np.sqrt(2)
+    assert np.allclose(q.state, expected)
+    q.Z(0)
+    assert np.allclose(q[3], -1 / np.sqrt(2))
+    assert np.allclose(q.to_numpy(), expected * [1, 1, 1, -1])
+
+def test_h_twice_leaves_qubit_unchanged():
+    v = random_state(np.random.default_rng(0), 3)
+    q = QuantumState(v.copy(), dtype=np.complex128)
+    for i in range(3):
+        q.H(i)
+        q.H(i)
+    assert np.allclose(q.state, v, rtol=0, atol=1e-12)
+
+def test_small_rotations_accumulate():
+    n_steps = 1000
+    phase = np.diag([1, np.exp(1e-6j)])
+    q = QuantumState.from_qubits([1, 0], [1, 0], dtype=np.complex128)
+    q.H(0)
+    for _ in range(n_steps):
+        q.apply_gate(phase, 0)
+    expected = np.array([1, np.exp(1e-6j * n_steps), 0, 0]) / np.sqrt(2)
+    assert np.allclose(q.state, expected, rtol=0, atol=1e-12)
+
+def test_state_setter_resets_state():
+    q = QuantumState.from_qubits([1, 0], [1, 0])
+    q.H(0)
+    q.state = np.array([0, 0, 0, 0, 0, 0, 0, 1])
+    assert q.n_qubits == 3
+    assert q.state.dtype == np.complex64
+    q.X(2)
+    assert np.allclose(q.state, np.identity(8)[3])
+    with pytest.raises(Exception):
+        q.state = np.array([1, 1, 0])
+
+@pytest.mark.parametrize("threshold", [quantum_state.NUMBA_THRESHOLD, 1])
+@pytest.mark.parametrize("seed", range(5))
+def test_random_circuits_match_kron_reference(monkeypatch, threshold, seed):
+    monkeypatch.setattr(quantum_state, "NUMBA_THRESHOLD", threshold)
+    rng = np.random.default_rng(seed)
+    n = 4
+    v = random_state(rng, n)
+    q = QuantumState(v.copy(), dtype=np.complex128)
+    expected = v
+    for _ in range(40):
+        gate = rng.choice(["X", "Z", "H", "T", "Tdg", "CNOT", "apply_gate"])
+        if gate == "CNOT":
+            control, target = (int(i) for i in rng.choice(n, size=2, replace=False))
+            q.CNOT(control, target)
+            operator = full_operator(np.identity(4)[[0, 1, 3, 2]], [control, target], n)
+        elif gate == "apply_gate":
+            indices = [int(i) for i in rng.choice(n, size=int(rng.integers(1, 4)), replace=False)]
+            matrix = random_unitary(rng, 2 ** len(indices))
+            q.apply_gate(matrix, *indices)
+            operator = full_operator(matrix, indices, n)
+        else:
+            index = int(rng.integers(n))
+            getattr(q, gate)(index)
+            operator = full_operator(MATRICES[gate], [index], n)
+        expected = operator @ expected
+        if rng.random() < 0.3:
+            assert np.allclose(q.state, expected)
+    assert np.allclose(q.state, expected)
+
+def test_repeated_measurement_of_basis_state_is_stable():
+    q = QuantumState.from_qubits([1, 0], [0, 1])
+    q.H(0)
+    q.H(0)
+    for _ in range(100):
+        assert q.measure(0) == 1
+        assert q.measure(1) == 0
+    assert not np.isnan(q.state).any()
+    assert np.allclose(q.state, [0, 1, 0, 0])
+
+@pytest.mark.parametrize("threshold", [quantum_state.NUMBA_THRESHOLD, 1])
+@pytest.mark.parametrize("control, target", [(1, 1), (0, 0), (0, 3), (3, 0), (-1, 0), (0, -1)])
+def test_cnot_rejects_invalid_qubits(monkeypatch, threshold, control, target):
+    monkeypatch.setattr(quantum_state, "NUMBA_THRESHOLD", threshold)
+    q = QuantumState.from_qubits([1, 0], [0, 1], [1, 0])
+    with pytest.raises(Exception):
+        q.CNOT(control, target)
+    assert np.allclose(q.state, np.identity(8)[2])
+
+def test_seed_makes_measurements_reproducible():
+    samples = []
+    for _ in range(2):
+        q = QuantumState.from_qubits([1, 0], [1, 0], seed=7)
+        q.H(0)
+        samples.append(q.sample(0, 50))
+    assert np.array_equal(samples[0], samples[1])
+    assert 0 < samples[0].sum() < 50